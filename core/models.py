@@ -1,7 +1,11 @@
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
+# slots=True needs Python 3.10+; on 3.9 the results keep a regular __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class TaskStatus(str, Enum):
     OK = "OK"  # Task completed successfully or was idempotent (no change)
@@ -11,7 +15,7 @@ class TaskStatus(str, Enum):
     SKIPPED = "SKIPPED"  # Task was skipped due to the environment
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StandardResult:
     """
     Standard payload to be included in Nornir's Result.result.
@@ -21,7 +25,7 @@ class StandardResult:
     data: Optional[Any] = None  # To pass data between tasks (context sharing)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SubTaskResult:
     """Lightweight result object for internal sub-steps."""
     success: bool
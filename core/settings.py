@@ -1,18 +1,31 @@
+import functools
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Dict, List
 
 import yaml
 from dotenv import load_dotenv
 
-# Load env vars if present
-load_dotenv()
+from core.state import RuntimeConfig
+
+# Load env vars if present (skips dotenv's parent-directory search when there is no .env)
+_ENV_FILE = Path(".env")
+if _ENV_FILE.is_file():
+    load_dotenv(_ENV_FILE, override=False)
+
+# libyaml's C loader when PyYAML was built with it, pure-Python loader otherwise
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 # --- DATACLASSES (SCHEMA) ---
 
-@dataclass
+# Settings are read-only once loaded; slots=True needs Python 3.10+
+_SETTINGS_DATACLASS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+@dataclass(**_SETTINGS_DATACLASS)
 class FluxSettings:
     """Defines GitOps configuration."""
     enabled: bool = False
@@ -24,12 +37,14 @@ class FluxSettings:
     local_key_path: str = None
 
 
-@dataclass
+@dataclass(**_SETTINGS_DATACLASS)
 class K8sSettings:
     """Defines Kubernetes node and cluster configuration."""
     version: str = "1.29"
     pod_network_cidr: str = "10.244.0.0/16"
     cni_manifest_url: str = "https://github.com/flannel-io/flannel/releases/latest/download/kube-flannel.yml"
+    # Re-apply the CNI manifest even when the control-plane node is already Ready
+    cni_force_reapply: bool = False
 
     local_kubeconfig_path: str = "inventory/kubeconfig_admin.yaml"
     flux: FluxSettings = field(default_factory=FluxSettings)
@@ -39,46 +54,57 @@ class K8sSettings:
     sysctl_params: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SETTINGS_DATACLASS)
 class AppSettings:
     """Root configuration object."""
     k8s: K8sSettings = field(default_factory=K8sSettings)
     environment: str = "dev"
 
 
+# Field names per schema, resolved once at import instead of on every load
+_SCHEMA_FIELDS = {
+    schema: frozenset(f.name for f in fields(schema))
+    for schema in (FluxSettings, K8sSettings, AppSettings)
+}
+
+
 # --- LOADER LOGIC ---
 
-def load_settings(config_path: str = "cluster_config.yaml") -> AppSettings:
+def _build(schema, values: Dict[str, Any]):
+    """
+    Instantiates a settings dataclass from a mapping, dropping keys outside its schema.
+    """
+    known = _SCHEMA_FIELDS[schema]
+    return schema(**{k: v for k, v in values.items() if k in known})
+
+
+def load_settings(config_path: str = RuntimeConfig.CONFIG_FILE) -> AppSettings:
     """
     Loads configuration merging: Defaults (Schema) < YAML File (Config) < Environment Vars (Secrets).
+    The result is cached per resolved file: later calls reuse the same AppSettings instead of re-parsing.
     """
+    # Resolve first so every spelling of the same path maps to one cache entry
+    return _load_settings(Path(config_path).resolve())
+
 
+@functools.lru_cache(maxsize=None)
+def _load_settings(path: Path) -> AppSettings:
     # 1. Load YAML Config
     file_config = {}
-    path = Path(config_path)
     if path.exists():
         try:
-            with open(path, 'r') as f:
-                file_config = yaml.safe_load(f) or {}
+            # Raw bytes straight to the loader: no text-mode decoding pass
+            file_config = yaml.load(path.read_bytes(), Loader=YamlLoader) or {}
         except Exception as e:
             # We log to stdout/stderr since the logger might not be ready yet
-            print(f"[Warning] Failed to load {config_path}: {e}")
+            print(f"[Warning] Failed to load {path}: {e}")
 
     # 2. Load Environment Variables (Secrets & Overrides)
-    # We manually map only the keys that make sense to override via ENV
-    env_config = {
-        "environment": os.getenv("ENV"),
-        "k8s": {
-            "version": os.getenv("K8S_VERSION"),
-        },
-    }
-
-    # Cleanup: We remove None/Empty keys from ENV dictionaries
-    def clean_none(d: Union[Dict, None]):
-        if not isinstance(d, dict): return d
-        return {k: clean_none(v) for k, v in d.items() if v is not None and v != {}}
-
-    env_config = clean_none(env_config)
+    # We manually map only the keys that make sense to override via ENV;
+    # unset variables leave the file/default value in place
+    env = os.environ.get
+    env_environment = env("ENV")
+    env_k8s_version = env("K8S_VERSION")
 
     # 3. Merge Logic
 
@@ -88,28 +114,28 @@ def load_settings(config_path: str = "cluster_config.yaml") -> AppSettings:
         "pod_network_cidr": "10.244.0.0/16",
     }
     k8s_file = file_config.get("k8s", {})
-    k8s_env = env_config.get("k8s", {})
 
     # Nested Flux management
     flux_defaults = {"enabled": False}
     flux_file = k8s_file.get("flux", {})
-    flux_final = {**flux_defaults, **flux_file}
-    flux_obj = FluxSettings(**{k: v for k, v in flux_final.items() if k in FluxSettings.__annotations__})
+    flux_final = flux_defaults | flux_file
+    flux_obj = _build(FluxSettings, flux_final)
 
     # We remove 'flux' from the k8s dict before the final merge to handle it as an object
     if "flux" in k8s_file: del k8s_file["flux"]
 
-    k8s_final = {**k8s_defaults, **k8s_file, **k8s_env}
+    k8s_final = k8s_defaults | k8s_file
+    if env_k8s_version is not None:
+        k8s_final["version"] = env_k8s_version
 
-    k8s_args = {k: v for k, v in k8s_final.items() if k in K8sSettings.__annotations__}
-    k8s_args["flux"] = flux_obj  # We inject the FluxSettings object
+    k8s_final["flux"] = flux_obj  # We inject the FluxSettings object
 
-    k8s_obj = K8sSettings(**k8s_args)
+    k8s_obj = _build(K8sSettings, k8s_final)
 
     # --- App Root ---
-    app_env_val = env_config.get("environment") or file_config.get("environment", "dev")
+    app_env_val = env_environment or file_config.get("environment", "dev")
 
-    return AppSettings(
-        k8s=k8s_obj,
-        environment=app_env_val
-    )
\ No newline at end of file
+    return _build(AppSettings, {
+        "k8s": k8s_obj,
+        "environment": app_env_val,
+    })
\ No newline at end of file
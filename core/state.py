@@ -5,5 +5,7 @@ class RuntimeConfig:
     # Changed Default: True (Verbose by default)
     VERBOSE: bool = True
     CONFIG_FILE: str = "cluster_config.yaml"
+    # Max hosts operated on concurrently (0 = let Pyinfra size the pool)
+    PARALLEL: int = 0
 
 config = RuntimeConfig()
\ No newline at end of file
@@ -1,12 +1,14 @@
 from pyinfra.api import deploy
 
-from tasks.cri_containerd_setup import install_containerd
-from tasks.gitops_flux_setup import setup_fluxcd
-from tasks.k8s_control_plane_init import init_control_plane
-from tasks.k8s_node_preparation import prepare_k8s_node
-from tasks.k8s_tools_installation import install_kubernetes_tools
-from tasks.network_connectivity import check_internet_access
-from tasks.os_hostname_setup import set_hostname_and_hosts
+from tasks import (
+    check_internet_access,
+    init_control_plane,
+    install_containerd,
+    install_kubernetes_tools,
+    prepare_k8s_node,
+    set_hostname_and_hosts,
+    setup_fluxcd,
+)
 
 
 @deploy("Initialize Kubernetes Cluster")
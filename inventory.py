@@ -1,38 +1,52 @@
+from pathlib import Path
+
 import yaml
 
-from core.settings import load_settings
+from core.settings import YamlLoader, load_settings
+from core.state import config as global_config
 
-# Load App Configuration
-app_config = load_settings()
+# Load App Configuration (cached per path, honours --config)
+app_config = load_settings(global_config.CONFIG_FILE)
 
 # Load Hosts from YAML
 try:
-    with open("inventory/hosts.yaml", "r") as f:
-        hosts_yaml = yaml.safe_load(f) or {}
+    hosts_yaml = yaml.load(Path("inventory/hosts.yaml").read_bytes(), Loader=YamlLoader) or {}
 except FileNotFoundError:
     hosts_yaml = {}
 
 # Define Groups for Pyinfra
-k8s_control_plane = []
-local_machine = []
-k8s_worker = []
+# Group -> hosts index, built once at import so callers look groups up by key
+hosts_by_group = {
+    "local_machine": [],
+    "k8s_control_plane": [],
+    "k8s_worker": [],
+}
 
 for name, host_data in hosts_yaml.items():
-    groups = host_data.get("groups", [])
+    # Set once per host so the group membership tests below are hash lookups
+    groups = frozenset(host_data.get("groups", ()))
     hostname = host_data.get("hostname")
     user = host_data.get("username")
 
-    # Common Data
+    # Per-host Data (app_config is shared via the inventory's global data)
     data = {
         "ssh_user": user,
-        "app_config": app_config,
     }
 
     # Map to Pyinfra connector
     if "local_machine" in groups:
         # Use @local connector for the machine running pyinfra
-        local_machine.append(("@local", data))
-    elif "k8s_control_plane" in groups:
-        k8s_control_plane.append((hostname, data))
+        hosts_by_group["local_machine"].append(("@local", data))
+        continue
+
+    # Remote hosts always run with sudo
+    data["_sudo"] = True
+    if "k8s_control_plane" in groups:
+        hosts_by_group["k8s_control_plane"].append((hostname, data))
     elif "k8s_worker" in groups:
-        k8s_worker.append((hostname, data))
+        hosts_by_group["k8s_worker"].append((hostname, data))
+
+# Named aliases for the indexed groups
+k8s_control_plane = hosts_by_group["k8s_control_plane"]
+local_machine = hosts_by_group["local_machine"]
+k8s_worker = hosts_by_group["k8s_worker"]
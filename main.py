@@ -1,16 +1,9 @@
 from pathlib import Path
 
 import typer
-from pyinfra import context
-from pyinfra.api import State, connect, Inventory
-from pyinfra.api.operations import run_ops
-from pyinfra.api.state import StateStage
 from rich import print as rprint
-from rich.panel import Panel
 
-import inventory
-from core.state import config as global_config
-from deploy import deploy_init
+from core.state import RuntimeConfig, config as global_config
 
 app = typer.Typer(
     help="Calcifer Infrastructure Manager - K8s Automation",
@@ -27,9 +20,13 @@ def main(
             help="Disable detailed sub-step logging (Silent Mode)."
         ),
         config_file: Path = typer.Option(
-            "cluster_config.yaml", "--config", "-c",
+            RuntimeConfig.CONFIG_FILE, "--config", "-c",
             help="Path to the configuration YAML file.",
             exists=True, dir_okay=False, readable=True
+        ),
+        parallel: int = typer.Option(
+            0, "--parallel", "-p", min=0,
+            help="Max hosts to operate on concurrently (0 = automatic)."
         )
 ):
     """
@@ -38,8 +35,12 @@ def main(
     """
     global_config.VERBOSE = not quiet
     global_config.CONFIG_FILE = str(config_file)
+    global_config.PARALLEL = parallel
 
     if ctx.invoked_subcommand:
+        # Banner-only import: --help and completion never render it
+        from rich.panel import Panel
+
         subtitle = "v3.0 - Pyinfra Engine"
         if quiet:
             subtitle += " (Quiet Mode)"
@@ -53,35 +54,44 @@ def main(
         ))
 
 
+# CLI --target aliases -> inventory group names
+TARGET_GROUPS = {
+    "local": "local_machine",
+    "cp": "k8s_control_plane",
+    "workers": "k8s_worker",
+}
+
+
 def run_deploy(deploy_func, target_group=None):
     """
     Helper to run a pyinfra deploy.
     """
+    # Imported here so --help/completion skip Pyinfra, and the inventory
+    # (which loads settings) only loads after --config has been applied
+    from pyinfra import context
+    from pyinfra.api import Config, State, connect, Inventory
+    from pyinfra.api.operations import run_ops
+    from pyinfra.api.state import StateStage
+
+    import inventory
+
     # 1. Setup Inventory
-    hosts = []
-    if target_group == "local":
-        hosts = inventory.local_machine
-    elif target_group == "cp":
-        hosts = inventory.k8s_control_plane
-    elif target_group == "workers":
-        hosts = inventory.k8s_worker
+    group_name = TARGET_GROUPS.get(target_group)
+    if group_name:
+        hosts = inventory.hosts_by_group[group_name]
     else:
-        # All hosts
-        hosts = inventory.local_machine + inventory.k8s_control_plane + inventory.k8s_worker
+        # All hosts, in group index order (local, cp, workers)
+        hosts = [h for group_hosts in inventory.hosts_by_group.values() for h in group_hosts]
 
     if not hosts:
         rprint("[bold red]❌ No hosts found for the specified target group.[/bold red]")
         return
 
-    # Add sudo only to remote hosts
-    final_hosts = []
-    for host_name, host_data in hosts:
-        if host_name != "@local":
-            host_data["_sudo"] = True
-        final_hosts.append((host_name, host_data))
-
-    pyinfra_inventory = Inventory((final_hosts, {}))
-    state = State(pyinfra_inventory)
+    # Remote hosts already carry _sudo from the inventory loader;
+    # the settings are global data, stored once and visible as host.data.app_config
+    pyinfra_inventory = Inventory((hosts, {"app_config": inventory.app_config}))
+    # Hosts run concurrently on Pyinfra's pool, bounded by --parallel
+    state = State(pyinfra_inventory, Config(PARALLEL=global_config.PARALLEL))
     # state.config.SUDO = True
 
     # 2. Connect
@@ -114,6 +124,8 @@ def init(
     """
     [Idempotent] Provisions the Kubernetes cluster infrastructure.
     """
+    from deploy import deploy_init
+
     run_deploy(deploy_init, target_group=target)
 
 
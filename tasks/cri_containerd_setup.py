@@ -1,4 +1,4 @@
-from pyinfra.operations import apt, server, files, systemd
+from pyinfra.operations import apt, server, systemd
 
 from utils.logger import log_operation
 
@@ -13,6 +13,7 @@ def install_containerd():
         name="Install Containerd Dependencies",
         packages=["ca-certificates", "curl", "gnupg"],
         update=True,
+        no_recommends=True,
     )
 
     # 2. Add Docker Repo
@@ -21,37 +22,36 @@ def install_containerd():
         src="https://download.docker.com/linux/ubuntu/gpg",
     )
 
-    apt.repo(
+    docker_repo = apt.repo(
         name="Add Docker Apt Repo",
         src="deb [arch=amd64] https://download.docker.com/linux/ubuntu jammy stable",
         filename="docker",
     )
 
     # 3. Install Containerd
+    # The index refreshed in step 1 is still current; only a newly added
+    # Docker repo needs a second apt-get update
+    apt.update(
+        name="Update Apt Cache For Docker Repo",
+        _if=docker_repo.did_change,
+    )
+
     apt.packages(
         name="Install Containerd",
         packages=["containerd.io"],
-        update=True,
+        no_recommends=True,
     )
 
     # 4. Configure
-    files.directory(
-        name="Ensure /etc/containerd exists",
-        path="/etc/containerd",
-    )
-
-    # Generate default config if missing
+    # Generate the default config and enable SystemdCgroup in one remote call:
+    # no directory fact probe and no separate grep + sed round trips
     server.shell(
-        name="Generate default config.toml",
-        commands=["containerd config default > /etc/containerd/config.toml"],
-    )
-
-    # Patch Config
-    files.replace(
-        name="Enable SystemdCgroup",
-        path="/etc/containerd/config.toml",
-        text=r"SystemdCgroup = false",
-        replace="SystemdCgroup = true",
+        name="Generate config.toml with SystemdCgroup enabled",
+        commands=[
+            "mkdir -p /etc/containerd"
+            " && containerd config default > /etc/containerd/config.toml"
+            " && sed -i -e 's/SystemdCgroup = false/SystemdCgroup = true/' /etc/containerd/config.toml"
+        ],
     )
 
     # 5. Restart
@@ -9,18 +9,20 @@ def setup_fluxcd():
     """
     Install & Bootstrap FluxCD.
     """
-    config = host.data.app_config.k8s.flux
+    host_data = host.data
+    config = host_data.app_config.k8s.flux
     if not config.enabled:
         return
 
     # 1. Install CLI
+    # pipefail + curl -f: a failed download fails the step instead of piping nothing into bash
     server.shell(
         name="Install Flux CLI",
-        commands=["curl -s https://fluxcd.io/install.sh | sudo bash"],
+        commands=["bash -o pipefail -c 'curl -fsSL https://fluxcd.io/install.sh | sudo bash'"],
     )
 
     # 2. Upload SSH Key
-    ssh_user = host.data.ssh_user
+    ssh_user = host_data.ssh_user
     remote_ssh_dir = f"/home/{ssh_user}/.ssh"
     remote_key_path = f"{remote_ssh_dir}/flux_identity"
 
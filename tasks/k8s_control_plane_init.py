@@ -1,4 +1,5 @@
 from io import StringIO
+from string import Template
 
 from pyinfra import host
 from pyinfra.facts.files import File
@@ -6,32 +7,37 @@ from pyinfra.operations import server, files
 
 from utils.logger import log_operation
 
+# Parsed once at import; each host only substitutes its own values
+_KUBEADM_CONFIG = Template("""
+apiVersion: kubeadm.k8s.io/v1beta4
+kind: InitConfiguration
+nodeRegistration:
+  name: "$node_name"
+  taints: []
+---
+apiVersion: kubeadm.k8s.io/v1beta4
+kind: ClusterConfiguration
+networking:
+  podSubnet: "$pod_cidr"
+""")
+
 
 @log_operation
 def init_control_plane():
     """
     Initializes K8s CP and configures it locally using paths from Settings.
     """
-    config = host.data.app_config.k8s
+    host_data = host.data
+    config = host_data.app_config.k8s
     pod_cidr = config.pod_network_cidr
     cni_url = config.cni_manifest_url
+    cni_force_reapply = config.cni_force_reapply
     local_kube_path = config.local_kubeconfig_path
 
-    node_name = host.data.get("hostname") or host.name
+    node_name = host_data.get("hostname") or host.name
 
     # 1. Generate Config
-    config_content = f"""
-apiVersion: kubeadm.k8s.io/v1beta4
-kind: InitConfiguration
-nodeRegistration:
-  name: "{node_name}"
-  taints: []
----
-apiVersion: kubeadm.k8s.io/v1beta4
-kind: ClusterConfiguration
-networking:
-  podSubnet: "{pod_cidr}"
-"""
+    config_content = _KUBEADM_CONFIG.substitute(node_name=node_name, pod_cidr=pod_cidr)
     files.put(
         name="Generate Kubeadm Config",
         dest="/tmp/kubeadm-config.yaml",
@@ -46,12 +52,11 @@ networking:
         )
 
     # 3. Setup User Kubeconfig (Remote)
+    # install(1) creates the directory, copies and sets owner/mode in one command
     server.shell(
         name="Setup Remote User Kubeconfig",
         commands=[
-            "mkdir -p $HOME/.kube",
-            "cp /etc/kubernetes/admin.conf $HOME/.kube/config",
-            "chown $(id -u):$(id -g) $HOME/.kube/config",
+            "install -D -o $(id -u) -g $(id -g) -m 600 /etc/kubernetes/admin.conf $HOME/.kube/config",
         ],
     )
 
@@ -63,14 +68,28 @@ networking:
     )
 
     # 5. Install CNI
+    # A Ready node is taken as proof that a CNI is running (a proxy, not a check
+    # for the CNI's own objects), so the manifest download and apply are skipped.
+    # Trade-off: a changed cni_manifest_url or a new "latest" release is not
+    # picked up by an existing cluster unless k8s.cni_force_reapply is set.
+    cni_apply = f"kubectl apply -f {cni_url}"
+    if not cni_force_reapply:
+        cni_apply = (
+            f"{{ kubectl get node {node_name} -o jsonpath='{{.status.conditions[?(@.type==\"Ready\")].status}}'"
+            f" | grep -q True || {cni_apply}; }}"
+        )
     server.shell(
         name="Install CNI Plugin",
-        commands=[f"export KUBECONFIG=/etc/kubernetes/admin.conf && kubectl apply -f {cni_url}"],
+        commands=[f"export KUBECONFIG=/etc/kubernetes/admin.conf && {cni_apply}"],
     )
 
     # 6. Untaint Node
+    # Only issue the taint removal when the control-plane taint is actually present
     server.shell(
         name="Untaint Control Plane Node",
         commands=[
-            f"export KUBECONFIG=/etc/kubernetes/admin.conf && kubectl taint nodes {node_name} node-role.kubernetes.io/control-plane:NoSchedule- || true"],
-    )
\ No newline at end of file
+            "export KUBECONFIG=/etc/kubernetes/admin.conf"
+            f" && {{ kubectl get node {node_name} -o jsonpath='{{.spec.taints[*].key}}'"
+            " | grep -q node-role.kubernetes.io/control-plane"
+            f" && kubectl taint nodes {node_name} node-role.kubernetes.io/control-plane:NoSchedule- || true; }}"],
+    )
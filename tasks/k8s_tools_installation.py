@@ -21,10 +21,11 @@ def install_kubernetes_tools():
         mode="755",
     )
 
+    # pipefail: a failed download must fail the step, not dearmor an empty key
     server.shell(
         name="Download and dearmor Kubernetes Apt Key",
         commands=[
-            f"curl -fsSL https://pkgs.k8s.io/core:/stable:/{k8s_version}/deb/Release.key | gpg --dearmor -o /etc/apt/keyrings/kubernetes-archive-keyring.gpg --yes"
+            f"bash -o pipefail -c 'curl -fsSL https://pkgs.k8s.io/core:/stable:/{k8s_version}/deb/Release.key | gpg --dearmor -o /etc/apt/keyrings/kubernetes-archive-keyring.gpg --yes'"
         ],
     )
 
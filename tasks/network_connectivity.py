@@ -8,7 +8,8 @@ def check_internet_access():
     """
     Verifies if the host can reach the internet (Ping 1.1.1.1).
     """
+    # One packet is enough for a reachability check; -W/-w bound the wait to fail fast
     server.shell(
         name="Check Internet Connectivity",
-        commands=["ping -c 2 1.1.1.1"]
+        commands=["ping -c 1 -W 1 -w 2 1.1.1.1"]
     )
\ No newline at end of file
@@ -3,10 +3,24 @@ import logging
 from pathlib import Path
 
 from rich.console import Console
+from rich.text import Text
 
 # System logger configuration (non-UI)
 LOG_FILE = Path("calcifer.log")
-console = Console()
+
+# Created on first use: Console() probes the terminal and environment
+_console = None
+
+
+def get_console() -> Console:
+    """
+    Returns the shared Rich Console, creating it on first access.
+    """
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
 
 def setup_logger():
     """
@@ -42,16 +56,24 @@ def log_operation(func):
     Decorator to log the start and end of an operation on a single line.
     """
 
+    # The operation name is fixed per function: build the messages once, not per call
+    op_name = func.__name__.replace("_", " ").title()
+    # Markup is parsed here once; Console.print would re-parse a str on every call
+    start_line = Text.from_markup(f"🔹 [bold cyan]Starting operation:[/bold cyan] {op_name}...")
+    done_line = Text.from_markup(f"✅ [bold green]Operation completed:[/bold green] {op_name}   ")
+    failed_prefix = Text.from_markup(f"❌ [bold red]Operation failed:[/bold red] {op_name}")
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        op_name = func.__name__.replace("_", " ").title()
-        console.print(f"🔹 [bold cyan]Starting operation:[/bold cyan] {op_name}...", end="\r")
+        console = get_console()
+        console.print(start_line, end="\r")
         try:
             result = func(*args, **kwargs)
-            console.print(f"✅ [bold green]Operation completed:[/bold green] {op_name}   ")
-            return result
         except Exception as e:
-            console.print(f"❌ [bold red]Operation failed:[/bold red] {op_name} ({e})")
+            console.print(failed_prefix + f" ({e})")
             raise e
 
+        console.print(done_line)
+        return result
+
     return wrapper